@@ -2,6 +2,9 @@
 PRAGMA journal_mode = WAL;
 PRAGMA synchronous = NORMAL;
 
+-- Create every table in one transaction: a single commit instead of one per statement
+BEGIN;
+
 -- News items
 CREATE TABLE IF NOT EXISTS news_items (
     url TEXT NOT NULL,
@@ -84,3 +87,9 @@ CREATE TABLE IF NOT EXISTS last_seen_state (
     CHECK ((timestamp IS NULL) != (id IS NULL)),
     PRIMARY KEY (provider, stream, scope, symbol)
 );
+
+-- Cutoff indexes: commit_llm_batch and get_*_before filter on created_at_iso
+CREATE INDEX IF NOT EXISTS idx_news_items_created_at ON news_items(created_at_iso);
+CREATE INDEX IF NOT EXISTS idx_price_data_created_at ON price_data(created_at_iso);
+
+COMMIT;
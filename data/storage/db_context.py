@@ -1,20 +1,32 @@
 """Internal database context manager utilities for SQLite work."""
 
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from typing import Any
 
 from data.storage.storage_core import connect
 
 
 @contextmanager
-def _cursor_context(db_path: str, *, commit: bool = True) -> Iterator[sqlite3.Cursor]:
+def _cursor_context(
+    db_path: str,
+    *,
+    commit: bool = True,
+    row_factory: Callable[[sqlite3.Cursor, tuple[Any, ...]], Any] | None = sqlite3.Row,
+) -> Iterator[sqlite3.Cursor]:
     """Context manager for SQLite cursors with auto-commit/rollback."""
-    conn = connect(db_path)
-    conn.row_factory = sqlite3.Row  # Always enable dict-like row access
+    # Writers: autocommit driver mode plus an explicit BEGIN IMMEDIATE below, so the write
+    # lock is taken up front. Readers: legacy mode ("") only opens an implicit BEGIN before
+    # DML, so SELECTs pay nothing extra and stray writes are still discarded on close.
+    conn = connect(db_path, isolation_level=None if commit else "")
+    # Dict-like row access by default; pass row_factory=None for plain tuples
+    conn.row_factory = row_factory
 
     try:
         cursor = conn.cursor()
+        if commit:
+            cursor.execute("BEGIN IMMEDIATE")
         yield cursor
         if commit:
             conn.commit()
@@ -4,6 +4,7 @@ import logging
 import os
 import sqlite3
 from contextlib import closing
+from functools import cache
 from importlib.resources import files
 
 logger = logging.getLogger(__name__)
@@ -13,17 +14,14 @@ def connect(db_path: str, **kwargs) -> sqlite3.Connection:
     """Open a SQLite connection with required PRAGMAs enabled."""
     # Direct sqlite3.connect is allowed here: this helper is the sanctioned entry point
     # that applies required PRAGMAs before use elsewhere in the codebase.
+    # Busy timeout via the connect kwarg (sqlite3_busy_timeout) instead of a PRAGMA round trip
+    kwargs.setdefault("timeout", 5.0)
     conn = sqlite3.connect(db_path, **kwargs)
     try:
         conn.execute("PRAGMA foreign_keys = ON")
     except sqlite3.Error as e:
         logger.warning("Failed to enable SQLite foreign_keys pragma: %s", e)
 
-    try:
-        conn.execute("PRAGMA busy_timeout = 5000")
-    except sqlite3.Error as e:
-        logger.warning("Failed to apply SQLite busy_timeout pragma: %s", e)
-
     # Enforce WAL mode and synch (synch changes per connection, resets to FULL on new)
     try:
         conn.execute("PRAGMA journal_mode = WAL")
@@ -47,21 +45,33 @@ def _check_json1_support(conn: sqlite3.Connection) -> bool:
         return False
 
 
-def init_database(db_path: str) -> None:
-    """Initialize SQLite database, enforcing JSON1 support and schema."""
-    # Check JSON1 support at startup - fail fast if missing
+@cache
+def _json1_available() -> bool:
+    """Probe JSON1 support once per process; the linked SQLite library cannot change."""
     # In-memory connection is acceptable for capability checks; no disk access occurs.
     # sqlite3 connection context managers don't close the connection, so wrap with closing
     with closing(sqlite3.connect(":memory:")) as conn:
-        if not _check_json1_support(conn):
-            raise RuntimeError(
-                "SQLite JSON1 extension required but not available. "
-                "Install a SQLite build with JSON1 support (e.g., the 'pysqlite3-binary' package) "
-                "or use a Python distribution that bundles JSON1."
-            )
+        return _check_json1_support(conn)
+
 
+@cache
+def _schema_sql() -> str:
+    """Read the packaged schema.sql once per process."""
     # Read schema file using importlib.resources (works in packages)
-    schema_sql = files("data").joinpath("schema.sql").read_text()
+    return files("data").joinpath("schema.sql").read_text()
+
+
+def init_database(db_path: str) -> None:
+    """Initialize SQLite database, enforcing JSON1 support and schema."""
+    # Check JSON1 support at startup - fail fast if missing
+    if not _json1_available():
+        raise RuntimeError(
+            "SQLite JSON1 extension required but not available. "
+            "Install a SQLite build with JSON1 support (e.g., the 'pysqlite3-binary' package) "
+            "or use a Python distribution that bundles JSON1."
+        )
+
+    schema_sql = _schema_sql()
 
     # Execute schema
     # Use closing to ensure the connection releases WAL locks on Windows.
@@ -72,6 +82,12 @@ def init_database(db_path: str) -> None:
 
 def finalize_database(db_path: str) -> None:
     """Finalize database by checkpointing WAL and switching to DELETE mode."""
+    if db_path == ":memory:" or (
+        db_path.startswith("file:") and ("mode=memory" in db_path or ":memory:" in db_path)
+    ):
+        # In-memory databases have no WAL or sidecar files to fold back
+        return
+
     if not os.path.exists(db_path):
         raise FileNotFoundError(f"Database not found: {db_path}")
 
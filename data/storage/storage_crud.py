@@ -30,52 +30,55 @@ def store_news_items(db_path: str, items: list[NewsEntry]) -> None:
     if not items:
         return
 
-    with _cursor_context(db_path) as cursor:
-        for item in items:
-            article = item.article
-            normalized_url = _normalize_url(article.url)
-
-            try:
-                if isinstance(article.news_type, NewsType):
-                    news_type_value = article.news_type.value
-                else:
-                    news_type_value = NewsType(str(article.news_type)).value
-            except (TypeError, ValueError) as exc:
-                raise ValueError(
-                    f"Invalid news_type for NewsItem; expected NewsType or valid string: {exc}"
-                ) from exc
-
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO news_items
-                (url, headline, content, published_iso, source, news_type)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    normalized_url,
-                    article.headline,
-                    article.content,
-                    _datetime_to_iso(article.published),
-                    article.source,
-                    news_type_value,
-                ),
+    news_rows = []
+    symbol_rows = []
+    for item in items:
+        article = item.article
+        normalized_url = _normalize_url(article.url)
+
+        try:
+            if isinstance(article.news_type, NewsType):
+                news_type_value = article.news_type.value
+            else:
+                news_type_value = NewsType(str(article.news_type)).value
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Invalid news_type for NewsItem; expected NewsType or valid string: {exc}"
+            ) from exc
+
+        news_rows.append(
+            (
+                normalized_url,
+                article.headline,
+                article.content,
+                _datetime_to_iso(article.published),
+                article.source,
+                news_type_value,
             )
+        )
+        importance = None if item.is_important is None else int(item.is_important)
+        symbol_rows.append((normalized_url, item.symbol, importance))
 
-            importance = None if item.is_important is None else int(item.is_important)
-            cursor.execute(
-                """
-                INSERT INTO news_symbols
-                (url, symbol, is_important)
-                VALUES (?, ?, ?)
-                ON CONFLICT(url, symbol) DO UPDATE SET
-                    is_important = excluded.is_important
-            """,
-                (
-                    normalized_url,
-                    item.symbol,
-                    importance,
-                ),
-            )
+    # One executemany per table instead of an execute round trip per row
+    with _cursor_context(db_path) as cursor:
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO news_items
+            (url, headline, content, published_iso, source, news_type)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """,
+            news_rows,
+        )
+        cursor.executemany(
+            """
+            INSERT INTO news_symbols
+            (url, symbol, is_important)
+            VALUES (?, ?, ?)
+            ON CONFLICT(url, symbol) DO UPDATE SET
+                is_important = excluded.is_important
+        """,
+            symbol_rows,
+        )
 
 
 def store_social_discussions(db_path: str, items: list[SocialDiscussion]) -> None:
@@ -119,21 +122,23 @@ def store_price_data(db_path: str, items: list[PriceData]) -> None:
         return
 
     with _cursor_context(db_path) as cursor:
-        for item in items:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO price_data
-                (symbol, timestamp_iso, price, volume, session)
-                VALUES (?, ?, ?, ?, ?)
-            """,
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO price_data
+            (symbol, timestamp_iso, price, volume, session)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
                 (
                     item.symbol,
                     _datetime_to_iso(item.timestamp),
                     _decimal_to_text(item.price),
                     item.volume,
                     item.session.value,
-                ),
-            )
+                )
+                for item in items
+            ],
+        )
 
 
 def get_news_since(db_path: str, timestamp: datetime) -> list[NewsEntry]:
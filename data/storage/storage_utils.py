@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -19,15 +20,9 @@ from data.models import (
 )
 from utils.datetime_utils import normalize_to_utc
 
-
-def _normalize_url(url: str) -> str:
-    """Normalize URL by stripping common tracking parameters."""
-    parsed = urlparse(url)
-    # Lowercase the hostname for consistent deduplication
-    parsed = parsed._replace(netloc=parsed.netloc.lower())
-
-    # Common tracking parameters to remove
-    tracking_params = {
+# Common tracking parameters to remove
+_TRACKING_PARAMS = frozenset(
+    {
         "utm_source",
         "utm_medium",
         "utm_campaign",
@@ -39,10 +34,20 @@ def _normalize_url(url: str) -> str:
         "msclkid",
         "campaign",
     }
+)
+
+
+# Pure function of its input; polled feeds re-send the same URLs every cycle
+@lru_cache(maxsize=16384)
+def _normalize_url(url: str) -> str:
+    """Normalize URL by stripping common tracking parameters."""
+    parsed = urlparse(url)
+    # Lowercase the hostname for consistent deduplication
+    parsed = parsed._replace(netloc=parsed.netloc.lower())
 
     # Parse query parameters and filter out tracking ones
     query_params = parse_qs(parsed.query)
-    clean_params = {k: v for k, v in query_params.items() if k.lower() not in tracking_params}
+    clean_params = {k: v for k, v in query_params.items() if k.lower() not in _TRACKING_PARAMS}
 
     # Reconstruct query string with proper encoding
     if clean_params:
@@ -61,12 +66,13 @@ def _normalize_url(url: str) -> str:
 def _datetime_to_iso(dt: datetime) -> str:
     """Convert datetime to UTC ISO string format expected by database."""
     dt = normalize_to_utc(dt)
-    return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
 def _iso_to_datetime(iso_str: str) -> datetime:
     """Convert ISO string from database to UTC datetime object."""
-    return datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+    # fromisoformat accepts the trailing "Z" natively on Python 3.11+
+    return datetime.fromisoformat(iso_str)
 
 
 def _decimal_to_text(decimal_val: Decimal) -> str:
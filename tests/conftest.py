@@ -14,6 +14,7 @@ import httpx
 import pytest
 
 from data.storage import connect, init_database
+from data.storage.db_context import _cursor_context
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,6 @@ def cleanup_sqlite_artifacts(db_path: str):
     if not os.path.exists(db_path):
         return
 
-    gc.collect()
-
     # Removes connection, memory and files
     try:
         # Use closing() to ensure connection is properly closed
@@ -35,9 +34,7 @@ def cleanup_sqlite_artifacts(db_path: str):
     except sqlite3.Error as exc:
         logger.warning("Failed to checkpoint SQLite WAL for %s: %s", db_path, exc)
 
-    gc.collect()
-
-    # Fallback File Removal
+    # Fallback File Removal; only force a GC pass when a leaked connection still holds a lock
     for suffix in ("-wal", "-shm", ""):
         path = db_path + suffix
         try:
@@ -67,11 +64,36 @@ def temp_db_path():
     cleanup_sqlite_artifacts(db_path)
 
 
+@pytest.fixture(scope="session")
+def _schema_template(tmp_path_factory):
+    """Initialize the Market Sentiment Analyzer schema once per session and yield its path."""
+    template_path = str(tmp_path_factory.mktemp("schema") / "template.db")
+    init_database(template_path)
+    yield template_path
+    cleanup_sqlite_artifacts(template_path)
+
+
+@pytest.fixture
+def temp_db(tmp_path, _schema_template):
+    """Clone the schema template into a temporary database file and yield its path."""
+    # File-backed on purpose: shared-cache in-memory databases report write conflicts as
+    # SQLITE_LOCKED, which bypasses the busy timeout production connections rely on.
+    db_path = str(tmp_path / "test.db")
+    # Page-level copy via the backup API; avoids re-running schema DDL for every test.
+    with (
+        closing(sqlite3.connect(_schema_template)) as source,
+        closing(sqlite3.connect(db_path)) as target,
+    ):
+        source.backup(target)
+    yield db_path
+    cleanup_sqlite_artifacts(db_path)
+
+
 @pytest.fixture
-def temp_db(temp_db_path):
-    """Initialize a temporary Market Sentiment Analyzer database and yield its path."""
-    init_database(temp_db_path)
-    yield temp_db_path
+def db_cursor(temp_db):
+    """Yield one cursor on temp_db for the whole test, committing on teardown."""
+    with _cursor_context(temp_db) as cursor:
+        yield cursor
 
 
 @pytest.fixture
@@ -1,5 +1,12 @@
 """Shared factory helpers for building data model instances in tests."""
 
+from tests.factories.created_at import (
+    CREATED_1,
+    CREATED_2,
+    CREATED_3,
+    set_news_created_at,
+    set_price_created_at,
+)
 from tests.factories.models import (
     make_analysis_result,
     make_holdings,
@@ -10,10 +17,15 @@ from tests.factories.models import (
 )
 
 __all__ = [
+    "CREATED_1",
+    "CREATED_2",
+    "CREATED_3",
     "make_analysis_result",
     "make_holdings",
     "make_news_entry",
     "make_news_item",
     "make_price_data",
     "make_social_discussion",
+    "set_news_created_at",
+    "set_price_created_at",
 ]
@@ -0,0 +1,35 @@
+"""Shared helpers for pinning created_at_iso on stored rows in tests."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from data.storage.db_context import _cursor_context
+from data.storage.storage_utils import _datetime_to_iso, _normalize_url
+
+# Pinned created_at values, one minute apart, so cutoffs never depend on wall-clock spacing
+CREATED_1 = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+CREATED_2 = CREATED_1 + timedelta(minutes=1)
+CREATED_3 = CREATED_1 + timedelta(minutes=2)
+
+
+def set_news_created_at(db_path: str, url: str, created_at: datetime) -> None:
+    """Overwrite created_at_iso for the news item stored under url."""
+    with _cursor_context(db_path) as cursor:
+        cursor.execute(
+            "UPDATE news_items SET created_at_iso = ? WHERE url = ?",
+            (_datetime_to_iso(created_at), _normalize_url(url)),
+        )
+        assert cursor.rowcount == 1
+
+
+def set_price_created_at(
+    db_path: str, symbol: str, timestamp: datetime, created_at: datetime
+) -> None:
+    """Overwrite created_at_iso for the price row keyed by symbol and timestamp."""
+    with _cursor_context(db_path) as cursor:
+        cursor.execute(
+            "UPDATE price_data SET created_at_iso = ? WHERE symbol = ? AND timestamp_iso = ?",
+            (_datetime_to_iso(created_at), symbol, _datetime_to_iso(timestamp)),
+        )
+        assert cursor.rowcount == 1
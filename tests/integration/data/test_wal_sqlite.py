@@ -48,7 +48,7 @@ class TestWALSqlite:
     def test_wal_mode_functionality(self, temp_db):
         """WAL mode is enabled and functional with file-backed DB."""
         # Verify WAL mode is enabled
-        with _cursor_context(temp_db, commit=False) as cursor:
+        with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
             cursor.execute("PRAGMA journal_mode")
             mode = cursor.fetchone()[0]
             assert mode.lower() == "wal"
@@ -78,7 +78,7 @@ class TestWALSqlite:
         # VERIFY WAL MODE IS ENABLED
         # ========================================
 
-        with _cursor_context(temp_db, commit=False) as cursor:
+        with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
             cursor.execute("PRAGMA journal_mode")
             mode = cursor.fetchone()[0]
             assert mode.lower() == "wal"
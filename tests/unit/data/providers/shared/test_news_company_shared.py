@@ -275,9 +275,8 @@ class TestNewsCompanyShared:
 
         provider.client.get = mock_get
 
-        caplog.set_level("WARNING", logger=provider.__module__)
-
-        results = await provider.fetch_incremental()
+        with caplog.at_level("WARNING", logger=provider.__module__):
+            results = await provider.fetch_incremental()
 
         assert results == []
         assert any("instead of list" in message for message in caplog.messages)
@@ -84,9 +84,9 @@ class TestPricesShared:
         provider = provider_spec_prices.make_provider(symbols=["AAPL"])
         quote = provider_spec_prices.quote(price="invalid", timestamp=1_705_320_000)
         provider.client.get = AsyncMock(return_value=quote)
-        caplog.set_level("DEBUG", logger=provider.__module__)
 
-        results = await provider.fetch_incremental()
+        with caplog.at_level("DEBUG", logger=provider.__module__):
+            results = await provider.fetch_incremental()
 
         assert results == []
         assert any("invalid" in message for message in caplog.messages)
@@ -52,9 +52,11 @@ class TestRedditClient:
         monkeypatch.setattr(
             "data.providers.reddit.reddit_client.praw_exceptions.PrawcoreException", dummy_exc
         )
-        client.reddit = types.SimpleNamespace(  # type: ignore[assignment]
-            user=types.SimpleNamespace(me=lambda: (_ for _ in ()).throw(dummy_exc()))  # type: ignore[arg-type]
-        )
+
+        def raise_praw_error():
+            raise dummy_exc()
+
+        client.reddit = types.SimpleNamespace(user=types.SimpleNamespace(me=raise_praw_error))  # type: ignore[assignment]
 
         caplog.set_level("WARNING")
         assert client.validate_connection() is False
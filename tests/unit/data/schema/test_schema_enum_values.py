@@ -0,0 +1,46 @@
+"""Locks critical enum values against changes (values are stored in the database)."""
+
+import pytest
+
+from data.models import AnalysisType, NewsType, Session, Stance, Urgency
+from data.storage.state_enums import Provider, Scope, Stream
+
+
+class TestEnumValueLocks:
+    """Test that enum values never change (would break database)."""
+
+    @pytest.mark.parametrize(
+        "enum_cls, expected",
+        [
+            pytest.param(
+                Session,
+                {"REG": "REG", "PRE": "PRE", "POST": "POST", "CLOSED": "CLOSED"},
+                id="Session",
+            ),
+            pytest.param(
+                Stance, {"BULL": "BULL", "BEAR": "BEAR", "NEUTRAL": "NEUTRAL"}, id="Stance"
+            ),
+            pytest.param(
+                AnalysisType,
+                {
+                    "NEWS_ANALYSIS": "news_analysis",
+                    "SENTIMENT_ANALYSIS": "sentiment_analysis",
+                    "SEC_FILINGS": "sec_filings",
+                    "HEAD_TRADER": "head_trader",
+                },
+                id="AnalysisType",
+            ),
+            pytest.param(
+                NewsType, {"MACRO": "macro", "COMPANY_SPECIFIC": "company_specific"}, id="NewsType"
+            ),
+            pytest.param(Urgency, {"URGENT": "URGENT", "NOT_URGENT": "NOT_URGENT"}, id="Urgency"),
+            pytest.param(Provider, {"FINNHUB": "FINNHUB", "REDDIT": "REDDIT"}, id="Provider"),
+            pytest.param(
+                Stream, {"COMPANY": "COMPANY", "MACRO": "MACRO", "SOCIAL": "SOCIAL"}, id="Stream"
+            ),
+            pytest.param(Scope, {"GLOBAL": "GLOBAL", "SYMBOL": "SYMBOL"}, id="Scope"),
+        ],
+    )
+    def test_enum_values_unchanged(self, enum_cls, expected):
+        """Lock enum member names and values - these are stored in database."""
+        assert {member.name: member.value for member in enum_cls} == expected
@@ -4,17 +4,16 @@ import sqlite3
 
 import pytest
 
-from data.storage.db_context import _cursor_context
-
 
 class TestLastSeenStateSchema:
     """Validate column layout and constraints for last_seen_state."""
 
-    def test_table_has_expected_columns(self, temp_db):
+    def test_table_has_expected_columns(self, db_cursor):
         """Test table has expected columns."""
-        with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute("PRAGMA table_info(last_seen_state)")
-            columns = [row["name"] for row in cursor.fetchall()]
+        rows = db_cursor.execute(
+            "SELECT name FROM pragma_table_info('last_seen_state') ORDER BY cid"
+        ).fetchall()
+        columns = [row[0] for row in rows]
 
         assert columns == [
             "provider",
@@ -25,30 +24,31 @@ class TestLastSeenStateSchema:
             "id",
         ]
 
-    def test_primary_key_enforces_uniqueness(self, temp_db):
+    def test_primary_key_enforces_uniqueness(self, db_cursor):
         """Test primary key enforces uniqueness."""
-        with _cursor_context(temp_db) as cursor:
-            cursor.execute(
+        db_cursor.execute(
+            """
+            INSERT INTO last_seen_state (provider, stream, scope, symbol, timestamp, id)
+            VALUES ('FINNHUB', 'MACRO', 'GLOBAL', '__GLOBAL__', NULL, 1)
+            """
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db_cursor.execute(
                 """
                 INSERT INTO last_seen_state (provider, stream, scope, symbol, timestamp, id)
-                VALUES ('FINNHUB', 'MACRO', 'GLOBAL', '__GLOBAL__', NULL, 1)
+                VALUES ('FINNHUB', 'MACRO', 'GLOBAL', '__GLOBAL__', NULL, 2)
                 """
             )
 
-        with pytest.raises(sqlite3.IntegrityError), _cursor_context(temp_db) as cursor:
-            cursor.execute(
-                """
-                    INSERT INTO last_seen_state (provider, stream, scope, symbol, timestamp, id)
-                    VALUES ('FINNHUB', 'MACRO', 'GLOBAL', '__GLOBAL__', NULL, 2)
-                    """
-            )
-
-    def test_scope_check_constraint(self, temp_db):
+    def test_scope_check_constraint(self, db_cursor):
         """Test scope check constraint."""
-        with pytest.raises(sqlite3.IntegrityError), _cursor_context(temp_db) as cursor:
-            cursor.execute(
+        # Valid timestamp with a NULL id, so only the scope CHECK can reject the row
+        with pytest.raises(sqlite3.IntegrityError, match="CHECK constraint failed: scope"):
+            db_cursor.execute(
                 """
-                    INSERT INTO last_seen_state (provider, stream, scope, symbol, timestamp, id)
-                    VALUES ('FINNHUB', 'MACRO', 'INVALID', '__GLOBAL__', NULL, NULL)
-                    """
+                INSERT INTO last_seen_state (provider, stream, scope, symbol, timestamp, id)
+                VALUES ('FINNHUB', 'MACRO', 'INVALID', '__GLOBAL__', ?, NULL)
+                """,
+                ("2024-01-01T00:00:00+00:00",),
             )
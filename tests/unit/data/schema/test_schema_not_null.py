@@ -4,191 +4,121 @@ import sqlite3
 
 import pytest
 
-from data.storage.db_context import _cursor_context
+_TS = "2024-01-01T10:00:00Z"
+
+_INSERT_NEWS_ITEM = """
+    INSERT INTO news_items (url, headline, published_iso, source, news_type)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_INSERT_PRICE = """
+    INSERT INTO price_data (symbol, timestamp_iso, price)
+    VALUES (?, ?, ?)
+"""
+
+_INSERT_ANALYSIS = """
+    INSERT INTO analysis_results (
+        symbol,
+        analysis_type,
+        model_name,
+        stance,
+        confidence_score,
+        last_updated_iso,
+        result_json
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_HOLDING = """
+    INSERT INTO holdings (symbol, quantity, break_even_price, total_cost)
+    VALUES (?, ?, ?, ?)
+"""
 
 
 class TestNotNullConstraints:
     """Test NOT NULL constraints across all tables."""
 
-    def test_news_items_required_fields(self, temp_db):
-        """Test NOT NULL constraints on news_items table."""
-        with _cursor_context(temp_db) as cursor:
-            # Test url NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                    VALUES (NULL, 'Test', '2024-01-01T10:00:00Z', 'test', 'macro')
-                """)
-
-            # Test headline NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                    VALUES ('http://test.com', NULL, '2024-01-01T10:00:00Z', 'test', 'macro')
-                """)
-
-            # Test published_iso NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                    VALUES ('http://test.com', 'Test', NULL, 'test', 'macro')
-                """)
-
-            # Test source NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                    VALUES ('http://test.com', 'Test', '2024-01-01T10:00:00Z', NULL, 'macro')
-                """)
-
-            # Test news_type NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                    VALUES ('http://test.com', 'Test', '2024-01-01T10:00:00Z', 'test', NULL)
-                """)
-
-    def test_news_symbols_required_fields(self, temp_db):
+    @pytest.mark.parametrize(
+        "sql, params",
+        [
+            pytest.param(
+                _INSERT_NEWS_ITEM, (None, "Test", _TS, "test", "macro"), id="news_items.url"
+            ),
+            pytest.param(
+                _INSERT_NEWS_ITEM,
+                ("http://test.com", None, _TS, "test", "macro"),
+                id="news_items.headline",
+            ),
+            pytest.param(
+                _INSERT_NEWS_ITEM,
+                ("http://test.com", "Test", None, "test", "macro"),
+                id="news_items.published_iso",
+            ),
+            pytest.param(
+                _INSERT_NEWS_ITEM,
+                ("http://test.com", "Test", _TS, None, "macro"),
+                id="news_items.source",
+            ),
+            pytest.param(
+                _INSERT_NEWS_ITEM,
+                ("http://test.com", "Test", _TS, "test", None),
+                id="news_items.news_type",
+            ),
+            pytest.param(_INSERT_PRICE, (None, _TS, "150.00"), id="price_data.symbol"),
+            pytest.param(_INSERT_PRICE, ("AAPL", None, "150.00"), id="price_data.timestamp_iso"),
+            pytest.param(_INSERT_PRICE, ("AAPL", _TS, None), id="price_data.price"),
+            pytest.param(
+                _INSERT_ANALYSIS,
+                ("AAPL", "news_analysis", None, "BULL", 0.85, _TS, "{}"),
+                id="analysis_results.model_name",
+            ),
+            pytest.param(
+                _INSERT_ANALYSIS,
+                ("AAPL", "news_analysis", "gpt-4", "BULL", 0.85, _TS, None),
+                id="analysis_results.result_json",
+            ),
+            pytest.param(
+                _INSERT_HOLDING, ("AAPL", None, "150.00", "1500.00"), id="holdings.quantity"
+            ),
+            pytest.param(
+                _INSERT_HOLDING,
+                ("AAPL", "10", None, "1500.00"),
+                id="holdings.break_even_price",
+            ),
+        ],
+    )
+    def test_required_fields(self, db_cursor, sql, params):
+        """Test NOT NULL constraints reject NULL in each required column."""
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            db_cursor.execute(sql, params)
+
+    def test_news_symbols_required_fields(self, db_cursor):
         """Test NOT NULL constraints on news_symbols table."""
-        with _cursor_context(temp_db) as cursor:
-            # Prepare backing news rows for FK
-            cursor.execute(
-                """
-                INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                VALUES (
-                    'http://example.com/labels-symbol',
-                    'Label Test',
-                    '2024-01-01T10:00:00Z',
-                    'test',
-                    'macro'
-                )
-                """
-            )
-            cursor.execute(
-                """
-                INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                VALUES (
-                    'http://example.com/labels-symbol2',
-                    'Label Test',
-                    '2024-01-01T10:05:00Z',
-                    'test',
-                    'macro'
-                )
-                """
-            )
-            cursor.execute(
-                """
-                INSERT INTO news_items (url, headline, published_iso, source, news_type)
-                VALUES (
-                    'http://example.com/labels-type',
-                    'Label Test',
-                    '2024-01-01T10:10:00Z',
-                    'test',
-                    'macro'
-                )
-                """
-            )
-
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_symbols (url, symbol, is_important)
-                    VALUES ('http://example.com/labels-symbol', NULL, 1)
-                """)
-
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO news_symbols (url, symbol, is_important)
-                    VALUES (NULL, 'AAPL', 1)
-                """)
-
-            # is_important may be NULL, verify insert succeeds
-            cursor.execute("""
+        # Prepare backing news rows for FK
+        parents = [
+            ("http://example.com/labels-symbol", _TS),
+            ("http://example.com/labels-symbol2", "2024-01-01T10:05:00Z"),
+            ("http://example.com/labels-type", "2024-01-01T10:10:00Z"),
+        ]
+        db_cursor.executemany(
+            _INSERT_NEWS_ITEM,
+            [(url, "Label Test", published, "test", "macro") for url, published in parents],
+        )
+
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            db_cursor.execute("""
                 INSERT INTO news_symbols (url, symbol, is_important)
-                VALUES ('http://example.com/labels-type', 'AAPL', NULL)
+                VALUES ('http://example.com/labels-symbol', NULL, 1)
             """)
 
-    def test_price_data_required_fields(self, temp_db):
-        """Test NOT NULL constraints on price_data table."""
-        with _cursor_context(temp_db) as cursor:
-            # Test symbol NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO price_data (symbol, timestamp_iso, price)
-                    VALUES (NULL, '2024-01-01T10:00:00Z', '150.00')
-                """)
-
-            # Test timestamp_iso NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO price_data (symbol, timestamp_iso, price)
-                    VALUES ('AAPL', NULL, '150.00')
-                """)
-
-            # Test price NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO price_data (symbol, timestamp_iso, price)
-                    VALUES ('AAPL', '2024-01-01T10:00:00Z', NULL)
-                """)
-
-    def test_analysis_results_required_fields(self, temp_db):
-        """Test NOT NULL constraints on analysis_results table."""
-        with _cursor_context(temp_db) as cursor:
-            # Test model_name NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute(
-                    """
-                    INSERT INTO analysis_results 
-                    (
-                        symbol,
-                        analysis_type,
-                        model_name,
-                        stance,
-                        confidence_score,
-                        last_updated_iso,
-                        result_json
-                    )
-                    VALUES (
-                        'AAPL', 'news_analysis', NULL, 'BULL', 0.85,
-                        '2024-01-01T10:00:00Z', '{}'
-                    )
-                    """
-                )
-
-            # Test result_json NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute(
-                    """
-                    INSERT INTO analysis_results 
-                    (
-                        symbol,
-                        analysis_type,
-                        model_name,
-                        stance,
-                        confidence_score,
-                        last_updated_iso,
-                        result_json
-                    )
-                    VALUES (
-                        'AAPL', 'news_analysis', 'gpt-4', 'BULL', 0.85,
-                        '2024-01-01T10:00:00Z', NULL
-                    )
-                    """
-                )
-
-    def test_holdings_required_fields(self, temp_db):
-        """Test NOT NULL constraints on holdings table."""
-        with _cursor_context(temp_db) as cursor:
-            # Test quantity NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO holdings (symbol, quantity, break_even_price, total_cost)
-                    VALUES ('AAPL', NULL, '150.00', '1500.00')
-                """)
+        with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
+            db_cursor.execute("""
+                INSERT INTO news_symbols (url, symbol, is_important)
+                VALUES (NULL, 'AAPL', 1)
+            """)
 
-            # Test break_even_price NOT NULL
-            with pytest.raises(sqlite3.IntegrityError, match="NOT NULL"):
-                cursor.execute("""
-                    INSERT INTO holdings (symbol, quantity, break_even_price, total_cost)
-                    VALUES ('AAPL', '10', NULL, '1500.00')
-                """)
+        # is_important may be NULL, verify insert succeeds
+        db_cursor.execute("""
+            INSERT INTO news_symbols (url, symbol, is_important)
+            VALUES ('http://example.com/labels-type', 'AAPL', NULL)
+        """)
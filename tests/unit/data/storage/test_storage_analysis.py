@@ -8,6 +8,10 @@ from data.models import AnalysisResult, AnalysisType, Stance
 from data.storage import upsert_analysis_result
 from data.storage.db_context import _cursor_context
 
+_T_0900 = datetime(2024, 1, 15, 9, 0, tzinfo=UTC)
+_T_1000 = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+_T_1100 = datetime(2024, 1, 15, 11, 0, tzinfo=UTC)
+
 
 class TestAnalysisResultUpsert:
     """Test analysis result upsert operations"""
@@ -21,9 +25,9 @@ class TestAnalysisResultUpsert:
             model_name="gpt-4",
             stance=Stance.BULL,
             confidence_score=0.85,
-            last_updated=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+            last_updated=_T_1000,
             result_json='{"sentiment": "positive"}',
-            created_at=datetime(2024, 1, 15, 9, 0, tzinfo=UTC),
+            created_at=_T_0900,
         )
 
         # Store initial result
@@ -36,11 +40,9 @@ class TestAnalysisResultUpsert:
             model_name="gpt-4o",  # Should update
             stance=Stance.NEUTRAL,  # Should update
             confidence_score=0.75,  # Should update
-            last_updated=datetime(2024, 1, 15, 11, 0, tzinfo=UTC),  # Should update
+            last_updated=_T_1100,  # Should update
             result_json='{"sentiment": "neutral"}',  # Should update
-            created_at=datetime(
-                2024, 1, 15, 10, 0, tzinfo=UTC
-            ),  # Should be ignored (preserve original)
+            created_at=_T_1000,  # Should be ignored (preserve original)
         )
 
         # Upsert updated result
@@ -73,7 +75,7 @@ class TestAnalysisResultUpsert:
             model_name="claude-3",
             stance=Stance.BEAR,
             confidence_score=0.90,
-            last_updated=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+            last_updated=_T_1000,
             result_json='{"sentiment": "bearish"}',
             # created_at not provided
         )
@@ -8,7 +8,7 @@ import pytest
 
 from data.storage import connect, finalize_database, init_database
 from data.storage.db_context import _cursor_context
-from data.storage.storage_core import _check_json1_support
+from data.storage.storage_core import _check_json1_support, _json1_available
 
 
 class FakeConnection:
@@ -16,20 +16,16 @@ class FakeConnection:
         self,
         *,
         fail_foreign: bool = False,
-        fail_busy: bool = False,
         fail_wal: bool = False,
         fail_sync: bool = False,
     ) -> None:
         self.fail_foreign = fail_foreign
-        self.fail_busy = fail_busy
         self.fail_wal = fail_wal
         self.fail_sync = fail_sync
 
     def execute(self, sql: str):
         if sql == "PRAGMA foreign_keys = ON" and self.fail_foreign:
             raise sqlite3.Error("foreign key pragma failed")
-        if sql == "PRAGMA busy_timeout = 5000" and self.fail_busy:
-            raise sqlite3.Error("busy timeout pragma failed")
         if sql == "PRAGMA journal_mode = WAL" and self.fail_wal:
             raise sqlite3.Error("wal pragma failed")
         if sql == "PRAGMA synchronous = NORMAL" and self.fail_sync:
@@ -37,50 +33,45 @@ class FakeConnection:
         return None
 
 
-def test_connect_logs_when_foreign_keys_pragma_fails(monkeypatch, caplog):
-    """Test connect logs when foreign keys pragma fails."""
-    caplog.set_level("WARNING")
-    monkeypatch.setattr(
-        sqlite3, "connect", lambda *args, **kwargs: FakeConnection(fail_foreign=True)
-    )
+@pytest.mark.parametrize(
+    "flag, expected",
+    [
+        ("fail_foreign", "Failed to enable SQLite foreign_keys pragma"),
+        ("fail_wal", "Failed to set SQLite journal_mode=WAL"),
+        ("fail_sync", "Failed to set SQLite synchronous=NORMAL"),
+    ],
+)
+def test_connect_logs_when_pragma_fails(monkeypatch, caplog, flag, expected):
+    """Test connect logs a warning and still returns when a pragma fails."""
+    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: FakeConnection(**{flag: True}))
 
-    conn = connect("ignored.db")
+    with caplog.at_level("WARNING", logger=connect.__module__):
+        conn = connect("ignored.db")
 
     assert isinstance(conn, FakeConnection)
-    assert "Failed to enable SQLite foreign_keys pragma" in caplog.text
+    assert expected in caplog.text
 
 
-def test_connect_logs_when_busy_timeout_pragma_fails(monkeypatch, caplog):
-    """Test connect logs when busy timeout pragma fails."""
-    caplog.set_level("WARNING")
-    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: FakeConnection(fail_busy=True))
-
-    conn = connect("ignored.db")
-
-    assert isinstance(conn, FakeConnection)
-    assert "Failed to apply SQLite busy_timeout pragma" in caplog.text
-
-
-def test_connect_logs_when_wal_pragma_fails(monkeypatch, caplog):
-    """Test connect logs when WAL pragma fails."""
-    caplog.set_level("WARNING")
-    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: FakeConnection(fail_wal=True))
-
-    conn = connect("ignored.db")
+def test_connect_passes_busy_timeout_to_sqlite(monkeypatch):
+    """Test connect configures the busy timeout through sqlite3.connect, not a PRAGMA."""
+    captured: dict = {}
+    executed: list[str] = []
 
-    assert isinstance(conn, FakeConnection)
-    assert "Failed to set SQLite journal_mode=WAL" in caplog.text
+    class RecordingConnection(FakeConnection):
+        def execute(self, sql: str):
+            executed.append(sql)
+            return super().execute(sql)
 
+    def fake_connect(*args, **kwargs):
+        captured.update(kwargs)
+        return RecordingConnection()
 
-def test_connect_logs_when_sync_pragma_fails(monkeypatch, caplog):
-    """Test connect logs when synchronous pragma fails."""
-    caplog.set_level("WARNING")
-    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: FakeConnection(fail_sync=True))
+    monkeypatch.setattr(sqlite3, "connect", fake_connect)
 
-    conn = connect("ignored.db")
+    connect("ignored.db")
 
-    assert isinstance(conn, FakeConnection)
-    assert "Failed to set SQLite synchronous=NORMAL" in caplog.text
+    assert captured["timeout"] == 5.0
+    assert not any("busy_timeout" in sql for sql in executed)
 
 
 def test_connect_sets_wal_and_synchronous(tmp_path):
@@ -116,22 +107,29 @@ def test_check_json1_support_returns_false_when_extension_missing(caplog):
 
 def test_init_database_raises_when_json1_missing(monkeypatch, tmp_path):
     """Test init database raises when json1 missing."""
+    monkeypatch.setattr("data.storage.storage_core._json1_available", lambda: False)
 
-    class ContextlessConnection:
-        def __enter__(self):
-            return self
+    with pytest.raises(RuntimeError, match="SQLite JSON1 extension required"):
+        init_database(tmp_path / "fake.db")
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
 
-        def close(self):
-            pass
+def test_json1_probe_runs_once_per_process(monkeypatch):
+    """Test json1 probe result is cached after the first check."""
+    calls = []
 
-    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: ContextlessConnection())
-    monkeypatch.setattr("data.storage.storage_core._check_json1_support", lambda conn: False)
+    def fake_probe(conn):
+        calls.append(conn)
+        return True
 
-    with pytest.raises(RuntimeError, match="SQLite JSON1 extension required"):
-        init_database(tmp_path / "fake.db")
+    monkeypatch.setattr("data.storage.storage_core._check_json1_support", fake_probe)
+    _json1_available.cache_clear()
+    try:
+        assert _json1_available() is True
+        assert _json1_available() is True
+    finally:
+        _json1_available.cache_clear()
+
+    assert len(calls) == 1
 
 
 def test_finalize_database_raises_when_path_missing(tmp_path):
@@ -142,20 +140,37 @@ def test_finalize_database_raises_when_path_missing(tmp_path):
         finalize_database(str(missing))
 
 
+@pytest.mark.parametrize(
+    "db_path",
+    [
+        ":memory:",
+        "file::memory:?cache=shared",
+        "file:memdb_finalize?mode=memory&cache=shared",
+    ],
+)
+def test_finalize_database_skips_in_memory_database(monkeypatch, db_path):
+    """Test finalize database is a no-op for in-memory databases."""
+
+    def fail_connect(*args, **kwargs):
+        raise AssertionError("finalize_database should not open in-memory databases")
+
+    monkeypatch.setattr(sqlite3, "connect", fail_connect)
+
+    finalize_database(db_path)
+
+
 def test_finalize_database_switches_to_delete_mode(temp_db):
     """Test finalize database switches to delete mode."""
     finalize_database(temp_db)
 
-    # Check raw mode without re-enabling WAL
-    with closing(sqlite3.connect(temp_db)) as conn:
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA journal_mode")
-        mode = cursor.fetchone()[0]
+    # Check raw mode via a read-only handle; connect() would re-enable WAL
+    with closing(sqlite3.connect(f"file:{temp_db}?mode=ro", uri=True)) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
 
     assert mode.lower() == "delete"
 
     # Normal connections should restore WAL
-    with _cursor_context(temp_db, commit=False) as cursor:
+    with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
         cursor.execute("PRAGMA journal_mode")
         mode_wal = cursor.fetchone()[0]
 
@@ -2,13 +2,20 @@
 Tests cutoff/pagination logic for news and price data queries.
 """
 
-import time
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from data.models import Session
 from data.storage import get_news_before, get_prices_before, store_news_items, store_price_data
-from tests.factories import make_news_entry, make_price_data
+from tests.factories import (
+    CREATED_1,
+    CREATED_2,
+    CREATED_3,
+    make_news_entry,
+    make_price_data,
+    set_news_created_at,
+    set_price_created_at,
+)
 
 
 class TestCutoffQueries:
@@ -17,7 +24,6 @@ class TestCutoffQueries:
     def test_get_news_before_cutoff_filtering(self, temp_db):
         """Test news retrieval with created_at cutoff filtering for LLM batch processing"""
         # Create news items with different created_at times
-        # We need to insert them with delays to ensure different created_at_iso values
         base_time = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
 
         # First item - oldest
@@ -28,8 +34,6 @@ class TestCutoffQueries:
             source="Source",
             published=base_time,
         )
-        store_news_items(temp_db, [entry1])
-        time.sleep(1)  # 1 second delay to ensure different created_at
 
         # Second item - middle
         entry2 = make_news_entry(
@@ -39,11 +43,6 @@ class TestCutoffQueries:
             source="Source",
             published=base_time,
         )
-        store_news_items(temp_db, [entry2])
-
-        # Record cutoff time right after second item
-        cutoff = datetime.now(UTC)
-        time.sleep(1)  # 1 second delay before third item
 
         # Third item - newest
         entry3 = make_news_entry(
@@ -53,7 +52,15 @@ class TestCutoffQueries:
             source="Source",
             published=base_time,
         )
-        store_news_items(temp_db, [entry3])
+
+        # Store all items in one call, then pin their created_at order
+        store_news_items(temp_db, [entry1, entry2, entry3])
+        set_news_created_at(temp_db, entry1.url, CREATED_1)
+        set_news_created_at(temp_db, entry2.url, CREATED_2)
+        set_news_created_at(temp_db, entry3.url, CREATED_3)
+
+        # Cutoff falls right after second item
+        cutoff = CREATED_2 + timedelta(seconds=30)
 
         # Query news before cutoff (should get first 2 items)
         results = get_news_before(temp_db, cutoff)
@@ -76,7 +83,7 @@ class TestCutoffQueries:
         """Test get_news_before with boundary conditions using spaced items"""
         base_time = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
 
-        # Store first news item
+        # First news item
         entry1 = make_news_entry(
             symbol="AAPL",
             url="https://example.com/item1",
@@ -84,14 +91,8 @@ class TestCutoffQueries:
             source="Source",
             published=base_time,
         )
-        store_news_items(temp_db, [entry1])
-        time.sleep(1)  # 1 second delay
 
-        # Record time between items
-        between_cutoff = datetime.now(UTC)
-        time.sleep(1)  # 1 second delay
-
-        # Store second news item
+        # Second news item
         entry2 = make_news_entry(
             symbol="TSLA",
             url="https://example.com/item2",
@@ -99,7 +100,14 @@ class TestCutoffQueries:
             source="Source",
             published=base_time,
         )
-        store_news_items(temp_db, [entry2])
+
+        # Store both items in one call, then pin their created_at order
+        store_news_items(temp_db, [entry1, entry2])
+        set_news_created_at(temp_db, entry1.url, CREATED_1)
+        set_news_created_at(temp_db, entry2.url, CREATED_2)
+
+        # Cutoff falls between items
+        between_cutoff = CREATED_1 + timedelta(seconds=30)
 
         # Test 1: Cutoff before all items (should get nothing)
         past_cutoff = datetime(2020, 1, 1, tzinfo=UTC)
@@ -116,9 +124,8 @@ class TestCutoffQueries:
         results = get_news_before(temp_db, future_cutoff)
         assert len(results) == 2
 
-        # Test 4: Exact timestamp match with current time (should get both items)
-        exact_cutoff = datetime.now(UTC)
-        results = get_news_before(temp_db, exact_cutoff)
+        # Test 4: Exact timestamp match with newest item (inclusive, should get both items)
+        results = get_news_before(temp_db, CREATED_2)
         assert len(results) == 2
 
     def test_get_prices_before_cutoff_filtering(self, temp_db):
@@ -133,8 +140,6 @@ class TestCutoffQueries:
             price=Decimal("150.00"),
             session=Session.REG,
         )
-        store_price_data(temp_db, [price1])
-        time.sleep(1)  # 1 second delay
 
         # Second price - middle
         price2 = make_price_data(
@@ -143,11 +148,6 @@ class TestCutoffQueries:
             price=Decimal("200.00"),
             session=Session.PRE,
         )
-        store_price_data(temp_db, [price2])
-
-        # Record cutoff time right after second item
-        cutoff = datetime.now(UTC)
-        time.sleep(1)  # 1 second delay before third item
 
         # Third price - newest
         price3 = make_price_data(
@@ -156,7 +156,15 @@ class TestCutoffQueries:
             price=Decimal("151.00"),
             session=Session.POST,
         )
-        store_price_data(temp_db, [price3])
+
+        # Store all prices in one call, then pin their created_at order
+        store_price_data(temp_db, [price1, price2, price3])
+        set_price_created_at(temp_db, price1.symbol, price1.timestamp, CREATED_1)
+        set_price_created_at(temp_db, price2.symbol, price2.timestamp, CREATED_2)
+        set_price_created_at(temp_db, price3.symbol, price3.timestamp, CREATED_3)
+
+        # Cutoff falls right after second item
+        cutoff = CREATED_2 + timedelta(seconds=30)
 
         # Query prices before cutoff (should get first 2 items)
         results = get_prices_before(temp_db, cutoff)
@@ -179,7 +187,7 @@ class TestCutoffQueries:
         """Test get_prices_before with boundary conditions using spaced items"""
         base_time = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
 
-        # Store first price data point
+        # First price data point
         price1 = make_price_data(
             symbol="AAPL",
             timestamp=base_time,
@@ -187,14 +195,8 @@ class TestCutoffQueries:
             volume=1000000,
             session=Session.REG,
         )
-        store_price_data(temp_db, [price1])
-        time.sleep(1)  # 1 second delay
 
-        # Record time between items
-        between_cutoff = datetime.now(UTC)
-        time.sleep(1)  # 1 second delay
-
-        # Store second price data point
+        # Second price data point
         price2 = make_price_data(
             symbol="TSLA",
             timestamp=base_time + timedelta(hours=1),
@@ -202,7 +204,14 @@ class TestCutoffQueries:
             volume=2000000,
             session=Session.PRE,
         )
-        store_price_data(temp_db, [price2])
+
+        # Store both prices in one call, then pin their created_at order
+        store_price_data(temp_db, [price1, price2])
+        set_price_created_at(temp_db, price1.symbol, price1.timestamp, CREATED_1)
+        set_price_created_at(temp_db, price2.symbol, price2.timestamp, CREATED_2)
+
+        # Cutoff falls between items
+        between_cutoff = CREATED_1 + timedelta(seconds=30)
 
         # Test 1: Cutoff before all items (should get nothing)
         past_cutoff = datetime(2020, 1, 1, tzinfo=UTC)
@@ -220,7 +229,6 @@ class TestCutoffQueries:
         results = get_prices_before(temp_db, future_cutoff)
         assert len(results) == 2
 
-        # Test 4: Exact timestamp match with current time (should get both items)
-        exact_cutoff = datetime.now(UTC)
-        results = get_prices_before(temp_db, exact_cutoff)
+        # Test 4: Exact timestamp match with newest item (inclusive, should get both items)
+        results = get_prices_before(temp_db, CREATED_2)
         assert len(results) == 2
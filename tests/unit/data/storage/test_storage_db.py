@@ -6,6 +6,7 @@ import pytest
 
 from data.storage import init_database
 from data.storage.db_context import _cursor_context
+from data.storage.storage_core import _schema_sql
 
 
 class TestDatabaseInitialization:
@@ -45,6 +46,8 @@ class TestDatabaseInitialization:
 
         # Patch the files function in the storage_core module
         monkeypatch.setattr("data.storage.storage_core.files", mock_files)
+        # Drop any schema text cached by earlier init_database calls so the mock is hit
+        _schema_sql.cache_clear()
 
         with pytest.raises(FileNotFoundError, match="schema.sql"):
             init_database(temp_db_path)
@@ -52,14 +55,14 @@ class TestDatabaseInitialization:
     def test_wal_mode_enabled(self, temp_db):
         """Test WAL mode is properly enabled (requires file-backed DB)"""
         # Check WAL mode is enabled (database already initialized by fixture)
-        with _cursor_context(temp_db, commit=False) as cursor:
+        with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
             cursor.execute("PRAGMA journal_mode")
             mode = cursor.fetchone()[0]
             assert mode.lower() == "wal"
 
     def test_foreign_keys_enabled_by_default(self, temp_db):
         """Canary: every test connection should enforce FK constraints."""
-        with _cursor_context(temp_db, commit=False) as cursor:
+        with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
             cursor.execute("PRAGMA foreign_keys")
             val = cursor.fetchone()[0]
             assert val == 1
@@ -5,11 +5,20 @@ Tests commit/rollback behavior, cleanup, and row_factory configuration.
 """
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import closing
 
 import pytest
 
 from data.storage.db_context import _cursor_context
 
+_INSERT_PRICE_SQL = """
+    INSERT INTO price_data (symbol, timestamp_iso, price, session, volume)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SELECT_SYMBOL_SQL = "SELECT symbol FROM price_data WHERE symbol = ?"
+
 
 class TestCursorContext:
     """Test _cursor_context() context manager behavior"""
@@ -19,19 +28,12 @@ class TestCursorContext:
         # Insert data with commit=True (default)
         with _cursor_context(temp_db) as cursor:
             cursor.execute(
-                """
-                INSERT INTO price_data (symbol, timestamp_iso, price, session)
-                VALUES (?, ?, ?, ?)
-            """,
-                ("AAPL", "2024-01-01T00:00:00Z", "150.00", "REG"),
+                _INSERT_PRICE_SQL, ("AAPL", "2024-01-01T00:00:00Z", "150.00", "REG", None)
             )
 
         # Verify data was committed by reading in a new connection
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute(
-                "SELECT symbol FROM price_data WHERE timestamp_iso = ?",
-                ("2024-01-01T00:00:00Z",),
-            )
+            cursor.execute(_SELECT_SYMBOL_SQL, ("AAPL",))
             result = cursor.fetchone()
             assert result is not None
             assert result["symbol"] == "AAPL"
@@ -41,41 +43,69 @@ class TestCursorContext:
         # Try to insert with commit=False
         with _cursor_context(temp_db, commit=False) as cursor:
             cursor.execute(
-                """
-                INSERT INTO price_data (symbol, timestamp_iso, price, session)
-                VALUES (?, ?, ?, ?)
-            """,
-                ("TSLA", "2024-01-01T00:00:00Z", "200.00", "REG"),
+                _INSERT_PRICE_SQL, ("TSLA", "2024-01-01T00:00:00Z", "200.00", "REG", None)
             )
 
         # Verify data was NOT committed (should rollback on exit)
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute(
-                "SELECT symbol FROM price_data WHERE timestamp_iso = ?",
-                ("2024-01-01T00:00:00Z",),
-            )
+            cursor.execute(_SELECT_SYMBOL_SQL, ("TSLA",))
             result = cursor.fetchone()
             assert result is None
 
+    def test_cursor_context_writer_waits_for_lock_held_by_another_connection(self, temp_db):
+        """Test that a second writer waits for the lock instead of failing as locked"""
+
+        def insert_price(symbol):
+            with _cursor_context(temp_db) as cursor:
+                cursor.execute(
+                    _INSERT_PRICE_SQL, (symbol, "2024-01-01T00:00:00Z", "100.00", "REG", None)
+                )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with _cursor_context(temp_db) as cursor:
+                # The first write takes the lock until this context commits
+                cursor.execute(
+                    _INSERT_PRICE_SQL, ("AAPL", "2024-01-01T00:00:00Z", "150.00", "REG", None)
+                )
+                future = pool.submit(insert_price, "TSLA")
+                # Bounded wait: the writer must still be blocked while the lock is held
+                wait([future], timeout=0.2)
+                assert not future.done()
+
+            future.result(timeout=5)
+
+        with _cursor_context(temp_db, commit=False) as cursor:
+            cursor.execute("SELECT symbol FROM price_data ORDER BY symbol")
+            assert [row["symbol"] for row in cursor.fetchall()] == ["AAPL", "TSLA"]
+
+    def test_cursor_context_commit_true_takes_write_lock_on_entry(self, temp_db):
+        """Test that commit=True holds the write lock before any statement runs"""
+        with (
+            _cursor_context(temp_db),
+            closing(sqlite3.connect(temp_db, timeout=0)) as other,
+            pytest.raises(sqlite3.OperationalError, match="locked"),
+        ):
+            other.execute("BEGIN IMMEDIATE")
+
+    def test_cursor_context_commit_false_reads_open_no_transaction(self, temp_db):
+        """Test that commit=False SELECTs run without opening a transaction"""
+        with _cursor_context(temp_db, commit=False) as cursor:
+            cursor.execute(_SELECT_SYMBOL_SQL, ("AAPL",))
+            cursor.fetchall()
+            assert not cursor.connection.in_transaction
+
     def test_cursor_context_rollback_on_exception(self, temp_db):
         """Test that exceptions trigger rollback"""
         # Insert should be rolled back due to exception
         with pytest.raises(ValueError), _cursor_context(temp_db) as cursor:
             cursor.execute(
-                """
-                    INSERT INTO price_data (symbol, timestamp_iso, price, session)
-                    VALUES (?, ?, ?, ?)
-                """,
-                ("MSFT", "2024-01-01T00:00:00Z", "250.00", "REG"),
+                _INSERT_PRICE_SQL, ("MSFT", "2024-01-01T00:00:00Z", "250.00", "REG", None)
             )
             raise ValueError("Intentional error")
 
         # Verify rollback happened - no data should exist
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute(
-                "SELECT symbol FROM price_data WHERE symbol = ?",
-                ("MSFT",),
-            )
+            cursor.execute(_SELECT_SYMBOL_SQL, ("MSFT",))
             result = cursor.fetchone()
             assert result is None
 
@@ -84,20 +114,13 @@ class TestCursorContext:
         # BaseException should also trigger rollback
         with pytest.raises(SystemExit), _cursor_context(temp_db) as cursor:
             cursor.execute(
-                """
-                    INSERT INTO price_data (symbol, timestamp_iso, price, session)
-                    VALUES (?, ?, ?, ?)
-                """,
-                ("GOOGL", "2024-01-01T00:00:00Z", "300.00", "REG"),
+                _INSERT_PRICE_SQL, ("GOOGL", "2024-01-01T00:00:00Z", "300.00", "REG", None)
             )
             raise SystemExit("Simulated system exit")
 
         # Verify rollback happened
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute(
-                "SELECT symbol FROM price_data WHERE symbol = ?",
-                ("GOOGL",),
-            )
+            cursor.execute(_SELECT_SYMBOL_SQL, ("GOOGL",))
             result = cursor.fetchone()
             assert result is None
 
@@ -106,11 +129,7 @@ class TestCursorContext:
         # Insert a row
         with _cursor_context(temp_db) as cursor:
             cursor.execute(
-                """
-                INSERT INTO price_data (symbol, timestamp_iso, price, session, volume)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                ("AMZN", "2024-01-01T00:00:00Z", "175.00", "POST", 1000),
+                _INSERT_PRICE_SQL, ("AMZN", "2024-01-01T00:00:00Z", "175.00", "POST", 1000)
             )
 
         # Verify row_factory enables dict-like access
@@ -131,6 +150,15 @@ class TestCursorContext:
             assert row[1] == "175.00"
             assert row[2] == "POST"
 
+    def test_cursor_context_row_factory_none_returns_tuples(self, temp_db):
+        """Test that row_factory=None yields plain tuples"""
+        with _cursor_context(temp_db, commit=False, row_factory=None) as cursor:
+            cursor.execute("SELECT 1, 'a'")
+            row = cursor.fetchone()
+
+        assert type(row) is tuple
+        assert row == (1, "a")
+
     def test_cursor_context_cleanup_on_cursor_error(self, temp_db):
         """Test that connection cleanup happens even if cursor operations fail"""
         # Intentionally cause a SQL error
@@ -153,11 +181,7 @@ class TestCursorContext:
         # Then verify error path also closes connection
         with pytest.raises(RuntimeError), _cursor_context(temp_db) as cursor:
             cursor.execute(
-                """
-                    INSERT INTO price_data (symbol, timestamp_iso, price, session)
-                    VALUES (?, ?, ?, ?)
-                """,
-                ("META", "2024-01-01T00:00:00Z", "190.00", "REG"),
+                _INSERT_PRICE_SQL, ("META", "2024-01-01T00:00:00Z", "190.00", "REG", None)
             )
             raise RuntimeError("Test error")
 
@@ -2,6 +2,7 @@
 Tests holdings storage operations and upsert logic.
 """
 
+import re
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -9,6 +10,8 @@ from data.models import Holdings
 from data.storage import upsert_holdings
 from data.storage.db_context import _cursor_context
 
+_ISO_UTC = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
 
 class TestHoldingsUpsert:
     """Test holdings upsert operations"""
@@ -87,10 +90,8 @@ class TestHoldingsUpsert:
             """)
             created, updated = cursor.fetchone()
 
-            # Both should be valid ISO timestamps
-            assert created is not None
-            assert updated is not None
-            assert "T" in created and "T" in updated
-            assert created.endswith("Z") and updated.endswith("Z")
+            # Both should be valid second-precision UTC ISO timestamps
+            assert _ISO_UTC.fullmatch(created)
+            assert _ISO_UTC.fullmatch(updated)
             # Should be approximately the same time
             assert created == updated, "auto-set timestamps should match on insert"
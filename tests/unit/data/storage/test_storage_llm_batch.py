@@ -2,13 +2,13 @@
 Tests LLM batch operation storage and commit functionality.
 """
 
-import time
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from data.models import Session
 from data.storage import (
     commit_llm_batch,
+    db_context,
     get_news_since,
     get_news_symbols,
     get_price_data_since,
@@ -16,17 +16,31 @@ from data.storage import (
     store_price_data,
 )
 from data.storage.db_context import _cursor_context
-from data.storage.storage_utils import _iso_to_datetime, _normalize_url
-from tests.factories import make_news_entry, make_price_data
+from data.storage.storage_utils import _datetime_to_iso
+from tests.factories import (
+    CREATED_1,
+    CREATED_2,
+    CREATED_3,
+    make_news_entry,
+    make_price_data,
+    set_news_created_at,
+    set_price_created_at,
+)
+
 
+def _record_statements(monkeypatch) -> list[str]:
+    """Record every SQL statement run on connections opened by _cursor_context."""
+    statements: list[str] = []
+    original_connect = db_context.connect
 
-def _get_created_at(temp_db: str, url: str) -> datetime:
-    normalized_url = _normalize_url(url)
-    with _cursor_context(temp_db, commit=False) as cursor:
-        cursor.execute("SELECT created_at_iso FROM news_items WHERE url = ?", (normalized_url,))
-        row = cursor.fetchone()
-        assert row is not None
-        return _iso_to_datetime(row[0])
+    def recording_connect(db_path, **kwargs):
+        conn = original_connect(db_path, **kwargs)
+        # Trace callbacks receive the statement with bound parameters expanded
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(db_context, "connect", recording_connect)
+    return statements
 
 
 class TestBatchOperations:
@@ -36,72 +50,38 @@ class TestBatchOperations:
         """commit_llm_batch prunes rows <= cutoff and returns counts."""
         base_time = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
 
-        entry1 = make_news_entry(
-            symbol="AAPL",
-            url="https://example.com/news1",
-            headline="News 1",
-            is_important=True,
-            source="Source",
-            published=base_time,
-        )
-        store_news_items(temp_db, [entry1])
-        store_price_data(
-            temp_db,
-            [
-                make_price_data(
-                    symbol="AAPL",
-                    timestamp=base_time,
-                    price=Decimal("150.00"),
-                    session=Session.REG,
-                )
-            ],
-        )
-        time.sleep(1)
-
-        entry2 = make_news_entry(
-            symbol="TSLA",
-            url="https://example.com/news2",
-            headline="News 2",
-            is_important=False,
-            source="Source",
-            published=base_time,
-        )
-        store_news_items(temp_db, [entry2])
-        store_price_data(
-            temp_db,
-            [
-                make_price_data(
-                    symbol="TSLA",
-                    timestamp=base_time,
-                    price=Decimal("200.00"),
-                    session=Session.PRE,
-                )
-            ],
-        )
-
-        cutoff = datetime.now(UTC)
-        time.sleep(1)
-
-        entry3 = make_news_entry(
-            symbol="GOOGL",
-            url="https://example.com/news3",
-            headline="News 3",
-            is_important=None,
-            source="Source",
-            published=base_time,
-        )
-        store_news_items(temp_db, [entry3])
-        store_price_data(
-            temp_db,
-            [
-                make_price_data(
-                    symbol="GOOGL",
-                    timestamp=base_time,
-                    price=Decimal("100.00"),
-                    session=Session.POST,
-                )
-            ],
-        )
+        entries = [
+            make_news_entry(
+                symbol=symbol,
+                url=f"https://example.com/news{index}",
+                headline=f"News {index}",
+                is_important=is_important,
+                source="Source",
+                published=base_time,
+            )
+            for index, (symbol, is_important) in enumerate(
+                [("AAPL", True), ("TSLA", False), ("GOOGL", None)], start=1
+            )
+        ]
+        prices = [
+            make_price_data(symbol=symbol, timestamp=base_time, price=price, session=session)
+            for symbol, price, session in [
+                ("AAPL", Decimal("150.00"), Session.REG),
+                ("TSLA", Decimal("200.00"), Session.PRE),
+                ("GOOGL", Decimal("100.00"), Session.POST),
+            ]
+        ]
+        # Store each table in one call, then pin created_at order explicitly
+        store_news_items(temp_db, entries)
+        store_price_data(temp_db, prices)
+        for entry, price, created_at in zip(
+            entries, prices, (CREATED_1, CREATED_2, CREATED_3), strict=True
+        ):
+            set_news_created_at(temp_db, entry.url, created_at)
+            set_price_created_at(temp_db, price.symbol, price.timestamp, created_at)
+
+        # Cutoff falls between the second and third rows
+        cutoff = CREATED_2 + timedelta(seconds=30)
 
         result = commit_llm_batch(temp_db, cutoff)
 
@@ -123,10 +103,8 @@ class TestBatchOperations:
         assert remaining_prices[0].symbol == "GOOGL"
 
     def test_commit_llm_batch_empty_database(self, temp_db):
-        """Empty database should still set watermark and delete nothing."""
-        cutoff = datetime.now(UTC)
-
-        result = commit_llm_batch(temp_db, cutoff)
+        """Empty database deletes nothing and returns zero counts."""
+        result = commit_llm_batch(temp_db, CREATED_1)
 
         assert result == {"symbols_deleted": 0, "news_deleted": 0, "prices_deleted": 0}
 
@@ -140,7 +118,7 @@ class TestBatchOperations:
             source="Source",
         )
         store_news_items(temp_db, [entry1])
-        time.sleep(1)
+        set_news_created_at(temp_db, entry1.url, CREATED_1)
 
         entry2 = make_news_entry(
             symbol="TSLA",
@@ -150,10 +128,9 @@ class TestBatchOperations:
             source="Source",
         )
         store_news_items(temp_db, [entry2])
+        set_news_created_at(temp_db, entry2.url, CREATED_2)
 
-        exact_cutoff = _get_created_at(temp_db, entry2.url)
-
-        result = commit_llm_batch(temp_db, exact_cutoff)
+        result = commit_llm_batch(temp_db, CREATED_2)
 
         assert result["symbols_deleted"] == 2
         assert result["news_deleted"] == 2
@@ -170,12 +147,72 @@ class TestBatchOperations:
             source="Source",
         )
         store_news_items(temp_db, [entry])
+        set_news_created_at(temp_db, entry.url, CREATED_1)
 
-        cutoff = datetime.now(UTC) + timedelta(seconds=1)
-
-        result1 = commit_llm_batch(temp_db, cutoff)
+        result1 = commit_llm_batch(temp_db, CREATED_1)
         assert result1["symbols_deleted"] == 1
         assert result1["news_deleted"] == 1
 
-        result2 = commit_llm_batch(temp_db, cutoff)
+        result2 = commit_llm_batch(temp_db, CREATED_1)
         assert result2 == {"symbols_deleted": 0, "news_deleted": 0, "prices_deleted": 0}
+
+    def test_commit_llm_batch_statement_sequence(self, temp_db, monkeypatch):
+        """Pruning runs exactly three DELETEs inside one transaction."""
+        statements = _record_statements(monkeypatch)
+
+        commit_llm_batch(temp_db, CREATED_1)
+
+        assert [sql.split()[0] for sql in statements] == [
+            "BEGIN",
+            "DELETE",
+            "DELETE",
+            "DELETE",
+            "COMMIT",
+        ]
+
+    def test_commit_llm_batch_cutoff_uses_created_at_index(self, temp_db, monkeypatch):
+        """Every DELETE commit_llm_batch issues searches a created_at index, never a full scan."""
+        # Seed rows with distinct created_at values and ANALYZE them, so the planner
+        # chooses from real statistics rather than empty-table defaults
+        created = [_datetime_to_iso(CREATED_1 + timedelta(minutes=i)) for i in range(100)]
+        with _cursor_context(temp_db) as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO news_items (url, headline, published_iso, source, news_type,
+                                        created_at_iso)
+                VALUES (?, 'Headline', ?, 'UnitTest', 'macro', ?)
+                """,
+                [(f"https://example.com/news/{i}", iso, iso) for i, iso in enumerate(created)],
+            )
+            cursor.executemany(
+                "INSERT INTO news_symbols (url, symbol, created_at_iso) VALUES (?, 'AAPL', ?)",
+                [(f"https://example.com/news/{i}", iso) for i, iso in enumerate(created)],
+            )
+            cursor.executemany(
+                """
+                INSERT INTO price_data (symbol, timestamp_iso, price, created_at_iso)
+                VALUES ('AAPL', ?, '150.00', ?)
+                """,
+                [(iso, iso) for iso in created],
+            )
+        with _cursor_context(temp_db) as cursor:
+            cursor.execute("ANALYZE")
+
+        statements = _record_statements(monkeypatch)
+        commit_llm_batch(temp_db, CREATED_1)
+        # The ON DELETE CASCADE action re-reports its parent DELETE to the trace; keep one copy
+        deletes = list(dict.fromkeys(sql for sql in statements if sql.split()[0] == "DELETE"))
+        monkeypatch.undo()
+
+        plans = []
+        with _cursor_context(temp_db, commit=False) as cursor:
+            for sql in deletes:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plans.append(" ".join(row["detail"] for row in cursor.fetchall()))
+
+        # news_symbols, news_items, price_data; the first filters via a news_items subquery
+        assert len(plans) == 3
+        assert all("SCAN" not in plan for plan in plans)
+        assert "INDEX idx_news_items_created_at" in plans[0]
+        assert "INDEX idx_news_items_created_at" in plans[1]
+        assert "INDEX idx_price_data_created_at" in plans[2]
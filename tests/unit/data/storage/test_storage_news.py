@@ -31,16 +31,15 @@ class TestNewsItemStorage:
 
         normalized_url = _normalize_url(entry_primary.url)
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute("SELECT COUNT(*) FROM news_items")
-            assert cursor.fetchone()[0] == 1
-
             cursor.execute(
                 """
                 SELECT url, headline, source, news_type
                 FROM news_items
             """
             )
-            row = cursor.fetchone()
+            rows = cursor.fetchall()
+            assert len(rows) == 1
+            row = rows[0]
             assert row["url"] == normalized_url
             assert row["headline"] == "Apple News"
             assert row["source"] == "UnitTest"
@@ -71,10 +70,10 @@ class TestNewsItemStorage:
         store_news_items(temp_db, [])
 
         with _cursor_context(temp_db, commit=False) as cursor:
-            cursor.execute("SELECT COUNT(*) FROM news_items")
-            assert cursor.fetchone()[0] == 0
-            cursor.execute("SELECT COUNT(*) FROM news_symbols")
-            assert cursor.fetchone()[0] == 0
+            cursor.execute(
+                "SELECT EXISTS(SELECT 1 FROM news_items), EXISTS(SELECT 1 FROM news_symbols)"
+            )
+            assert tuple(cursor.fetchone()) == (0, 0)
 
 
 class TestNewsSymbolsStorage:
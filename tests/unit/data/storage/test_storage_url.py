@@ -83,3 +83,15 @@ class TestURLNormalization:
         for original, expected in test_cases:
             result = _normalize_url(original)
             assert result == expected
+
+    def test_normalize_url_caches_repeated_urls(self):
+        """Test repeated URLs are served from the normalization cache"""
+        _normalize_url.cache_clear()
+        url = "https://Example.com/story?utm_source=feed&id=7"
+
+        first = _normalize_url(url)
+        second = _normalize_url(url)
+
+        assert first == second == "https://example.com/story?id=7"
+        info = _normalize_url.cache_info()
+        assert (info.misses, info.hits) == (1, 1)